@@ -5,16 +5,14 @@ Accepts audio file uploads and returns summary CSV.
 """
 
 import os
-import csv
-import tempfile
-import shutil
 import uuid
 from pathlib import Path
 from typing import List, Dict, Optional
 from statistics import median
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import Response
+from fastapi import FastAPI, UploadFile, File, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import assemblyai as aai
 
@@ -47,12 +45,13 @@ def check_api_key() -> str:
     return api_key
 
 
-def process_uploaded_files(files: List[UploadFile], temp_dir: Path, api_key: str) -> List[Dict]:
+def process_uploaded_files(
+    files: List[UploadFile], api_key: str, use_cache: bool = True
+) -> List[Dict]:
     """
     Process uploaded audio files and return summary statistics.
+    Uploads are streamed to AssemblyAI directly, without a temp file copy.
     """
-    all_summaries = []
-    
     for uploaded_file in files:
         # Check file extension
         file_ext = Path(uploaded_file.filename).suffix.lower()
@@ -61,20 +60,18 @@ def process_uploaded_files(files: List[UploadFile], temp_dir: Path, api_key: str
                 status_code=400,
                 detail=f"Unsupported file type: {uploaded_file.filename}. Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}"
             )
-        
-        # Save uploaded file to temp directory
-        file_path = temp_dir / uploaded_file.filename
-        try:
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(uploaded_file.file, f)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to save uploaded file {uploaded_file.filename}: {str(e)}"
-            )
-        
-        # Transcribe
-        transcript = latency_module.transcribe_audio(file_path, api_key)
+    
+    # Transcribe all files concurrently
+    transcripts = latency_module.transcribe_many(
+        [uploaded_file.file for uploaded_file in files],
+        api_key,
+        use_cache,
+        filenames=[uploaded_file.filename for uploaded_file in files],
+    )
+    
+    all_summaries = []
+    
+    for uploaded_file, transcript in zip(files, transcripts):
         if not transcript:
             raise HTTPException(
                 status_code=500,
@@ -88,8 +85,7 @@ def process_uploaded_files(files: List[UploadFile], temp_dir: Path, api_key: str
             continue
         
         # Calculate summary statistics
-        stats = latency_module.calculate_summary_stats(turns)
-        num_speaker_changes = sum(1 for t in turns if t.get("speaker_change"))
+        stats, num_speaker_changes = latency_module.calculate_summary_stats(turns)
         
         summary = {
             "file": uploaded_file.filename,
@@ -113,11 +109,15 @@ async def root():
 
 
 @app.post("/analyze")
-async def analyze_audio(files: List[UploadFile] = File(...)):
+async def analyze_audio(
+    files: List[UploadFile] = File(...),
+    cache_control: Optional[str] = Header(None),
+):
     """
     Analyze uploaded audio files and return summary CSV.
     
     Accepts multiple audio files via multipart/form-data with field name "files".
+    Send "Cache-Control: no-store" to skip the transcript cache.
     Returns summary_all_audios.csv as a downloadable CSV file.
     """
     # Check if files were uploaded
@@ -130,12 +130,12 @@ async def analyze_audio(files: List[UploadFile] = File(...)):
     # Check API key
     api_key = check_api_key()
     
-    # Create unique temp directory for this request
-    temp_dir = Path(tempfile.mkdtemp(prefix="latency_"))
+    use_cache = "no-store" not in (cache_control or "").lower()
     
     try:
-        # Process files
-        all_summaries = process_uploaded_files(files, temp_dir, api_key)
+        # Process files in the threadpool so transcription (blocking network
+        # I/O) doesn't stall the event loop for other requests
+        all_summaries = await run_in_threadpool(process_uploaded_files, files, api_key, use_cache)
         
         if not all_summaries:
             raise HTTPException(
@@ -143,25 +143,16 @@ async def analyze_audio(files: List[UploadFile] = File(...)):
                 detail="No valid audio data found in uploaded files. Please check that files contain speaker diarization data."
             )
         
-        # Create summary CSV in memory
-        fieldnames = [
-            "file", "turns", "speaker_changes",
-            "avg_gap_ms", "median_gap_ms", "p95_gap_ms",
-            "overlap_rate", "avg_positive_gap_ms"
-        ]
-        
-        # Write CSV to string
-        import io
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_summaries)
-        csv_content = output.getvalue()
-        output.close()
+        # Stream the summary CSV one row at a time (async generator, so
+        # Starlette does not hop to the threadpool for every chunk)
+        async def iter_csv():
+            yield latency_module.SUMMARY_HEADER.encode("utf-8")
+            for summary in all_summaries:
+                yield latency_module.format_summary_row(summary).encode("utf-8")
         
         # Return CSV file
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            iter_csv(),
             media_type="text/csv",
             headers={
                 "Content-Disposition": 'attachment; filename="summary_all_audios.csv"'
@@ -176,13 +167,11 @@ async def analyze_audio(files: List[UploadFile] = File(...)):
             status_code=500,
             detail=f"Processing failed: {str(e)}"
         )
-    finally:
-        # Clean up temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Workers need an import string instead of the app object
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers)